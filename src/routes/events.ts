@@ -28,16 +28,30 @@ router.get('/:id/events', authRequired, async (req: Request, res: Response) => {
   res.write(`event: connected\n`);
   res.write(`data: ${JSON.stringify({ meetingId, timestamp: new Date().toISOString() })}\n\n`);
   
-  // Polling interval: check DynamoDB every 3 seconds
-  const statusInterval = setInterval(async () => {
+  // Poll DynamoDB with backoff: start fast, slow down (x1.5, max 10s) while nothing
+  // changes, and drop back to the minimum as soon as status or lastUpdatedAt moves
+  const minPollMs = 500;
+  const maxPollMs = 10000;
+  let pollDelayMs = minPollMs;
+  let lastSeen: string | null = null;
+  let closed = false;
+  let statusTimer: NodeJS.Timeout | undefined;
+
+  const scheduleNextPoll = () => {
+    if (closed) return;
+    statusTimer = setTimeout(pollStatus, pollDelayMs);
+  };
+
+  const pollStatus = async () => {
     try {
       // Fetch fresh state from DynamoDB (stateless - no memory storage)
       const meeting = await ddbService.getMeeting(meetingId);
+      if (closed) return;
       
       if (!meeting) {
         res.write(`event: error\n`);
         res.write(`data: ${JSON.stringify({ error: 'Meeting not found' })}\n\n`);
-        clearInterval(statusInterval);
+        closed = true;
         clearInterval(keepaliveInterval);
         res.end();
         return;
@@ -56,13 +70,23 @@ router.get('/:id/events', authRequired, async (req: Request, res: Response) => {
         hasActions: meeting.actions && meeting.actions.length > 0,
         timestamp: new Date().toISOString()
       })}\n\n`);
+
+      const current = `${meeting.status}|${meeting.lastUpdatedAt}`;
+      pollDelayMs = current !== lastSeen ? minPollMs : Math.min(Math.round(pollDelayMs * 1.5), maxPollMs);
+      lastSeen = current;
       
     } catch (error: any) {
+      if (closed) return;
       console.error(`❌ SSE polling error for meeting ${meetingId}:`, error.message);
       res.write(`event: error\n`);
       res.write(`data: ${JSON.stringify({ error: 'Failed to fetch meeting status' })}\n\n`);
+      pollDelayMs = Math.min(Math.round(pollDelayMs * 1.5), maxPollMs);
     }
-  }, 3000); // Poll every 3 seconds
+
+    scheduleNextPoll();
+  };
+
+  scheduleNextPoll();
   
   // Keepalive ping: send every 15 seconds to prevent connection timeout
   const keepaliveInterval = setInterval(() => {
@@ -72,7 +96,8 @@ router.get('/:id/events', authRequired, async (req: Request, res: Response) => {
   // Graceful cleanup on disconnect
   req.on('close', () => {
     console.log(`📡 SSE connection closed for meeting ${meetingId}`);
-    clearInterval(statusInterval);
+    closed = true;
+    clearTimeout(statusTimer);
     clearInterval(keepaliveInterval);
     
     // Send final event before closing (best effort - may not reach client)
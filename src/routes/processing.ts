@@ -7,7 +7,7 @@ import { s3Service } from '../services/s3';
 import { ddbService } from '../services/ddb';
 import { getSQSService } from '../services/sqs';
 import { FFmpegService } from '../services/ffmpegService';
-import { OpenAIService } from '../services/openaiService';
+import { openaiService } from '../services/openaiService';
 import { ActionsFallbackService } from '../services/actionsFallback';
 import { GetObjectCommand, S3Client } from '@aws-sdk/client-s3';
 import { config } from '../config';
@@ -15,7 +15,6 @@ import { makeTempDir, cleanupDir } from '../utils/temp';
 
 const router = Router();
 const ffmpegService = new FFmpegService();
-const openaiService = new OpenAIService();
 const fallbackService = new ActionsFallbackService();
 
 const s3Client = new S3Client({ region: config.awsRegion });
@@ -174,18 +173,13 @@ router.post('/:id/transcribe', authRequired, requireGroup('Admin'), async (req,
     // Generate caption files
     const captions = openaiService.generateCaptions(segments);
     
-    const srtPath = path.join(tempDir, 'captions.srt');
-    const vttPath = path.join(tempDir, 'captions.vtt');
-    
-    fs.writeFileSync(srtPath, captions.srt);
-    fs.writeFileSync(vttPath, captions.vtt);
-    
     // Upload captions to S3 (idempotent - same keys)
+    // Sent straight from memory: a temp-file round trip would only add blocking disk I/O
     const srtKey = `${meeting.s3Prefix}/captions.srt`;
     const vttKey = `${meeting.s3Prefix}/captions.vtt`;
     
-    await s3Service.putObject(srtKey, fs.readFileSync(srtPath), 'text/plain');
-    await s3Service.putObject(vttKey, fs.readFileSync(vttPath), 'text/vtt');
+    await s3Service.putObject(srtKey, Buffer.from(captions.srt, 'utf-8'), 'text/plain');
+    await s3Service.putObject(vttKey, Buffer.from(captions.vtt, 'utf-8'), 'text/vtt');
     
     // Save captions metadata to DynamoDB
     await ddbService.createCaptions({
@@ -45,7 +45,7 @@ export class FFmpegService {
     });
   }
 
-  private async getVideoDuration(inputPath: string): Promise<number> {
+  async getVideoDuration(inputPath: string): Promise<number> {
     return new Promise((resolve, reject) => {
       const child = spawn(this.ffmpegBin, ['-i', inputPath, '-f', 'null', '-'], { stdio: 'pipe', shell: process.platform === 'win32' });
       
@@ -78,6 +78,27 @@ export class FFmpegService {
     });
   }
 
+  /**
+   * Split an audio file into fixed-length chunks without re-encoding
+   * @returns Chunk paths in playback order
+   */
+  async segmentAudio(inputPath: string, outputDir: string, segmentSeconds: number): Promise<string[]> {
+    fs.mkdirSync(outputDir, { recursive: true });
+
+    const ext = path.extname(inputPath) || '.mp3';
+    await this.runFFmpeg([
+      '-y', '-i', inputPath,
+      '-f', 'segment', '-segment_time', segmentSeconds.toString(),
+      '-c', 'copy',
+      path.join(outputDir, `chunk_%03d${ext}`)
+    ]);
+
+    return fs.readdirSync(outputDir)
+      .filter(file => file.startsWith('chunk_') && file.endsWith(ext))
+      .map(file => path.join(outputDir, file))
+      .sort();
+  }
+
   async transcodeVideo(inputPath: string, outputDir: string): Promise<TranscodeResult> {
     // Ensure output directory exists
     fs.mkdirSync(outputDir, { recursive: true });
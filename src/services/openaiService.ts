@@ -4,6 +4,16 @@ import path from 'path';
 import https from 'https';
 import { config } from '../config';
 import { getOpenAIKey } from './secrets';
+import { FFmpegService } from './ffmpegService';
+
+// Whisper rejects uploads over 25MB; longer recordings are split and transcribed in parallel.
+// Chunk length is derived from the file's average bitrate so each chunk lands near
+// CHUNK_TARGET_BYTES, leaving headroom for VBR peaks and segment boundary overshoot
+const MAX_UPLOAD_BYTES = 25 * 1024 * 1024;
+const CHUNK_TARGET_BYTES = 20 * 1024 * 1024;
+const MAX_CHUNK_SECONDS = 600;
+const MIN_CHUNK_SECONDS = 30;
+const MAX_CONCURRENT_CHUNKS = 4;
 
 interface TranscriptSegment {
   start: number;
@@ -25,6 +35,7 @@ export class OpenAIService {
   private client?: OpenAI;
   private initPromise?: Promise<void>;
   private initialized = false;
+  private ffmpeg = new FFmpegService();
   
   constructor() {
     // Lazy initialization - client will be created on first use
@@ -98,10 +109,69 @@ export class OpenAIService {
     const stats = fs.statSync(audioPath);
     console.log(`Audio file size: ${stats.size} bytes (${(stats.size / 1024 / 1024).toFixed(1)} MB)`);
 
-    if (stats.size > 25 * 1024 * 1024) {
-      throw new Error(`Audio file too large: ${(stats.size / 1024 / 1024).toFixed(1)}MB (max 25MB)`);
+    if (stats.size > MAX_UPLOAD_BYTES) {
+      return this.transcribeInChunks(audioPath, stats.size);
     }
-    
+
+    return this.transcribeFile(audioPath);
+  }
+
+  /**
+   * Split oversized audio into chunks under the upload limit, transcribe them concurrently
+   * and stitch the segments back together with timestamps offset per chunk
+   */
+  private async transcribeInChunks(audioPath: string, sizeBytes: number): Promise<TranscriptSegment[]> {
+    const duration = await this.ffmpeg.getVideoDuration(audioPath);
+    const chunkSeconds = Math.max(
+      MIN_CHUNK_SECONDS,
+      Math.min(MAX_CHUNK_SECONDS, Math.floor(duration * CHUNK_TARGET_BYTES / sizeBytes))
+    );
+
+    const chunkDir = fs.mkdtempSync(path.join(path.dirname(audioPath), 'chunks-'));
+
+    try {
+      const chunks = await this.ffmpeg.segmentAudio(audioPath, chunkDir, chunkSeconds);
+      if (chunks.length === 0) {
+        throw new Error(`Audio segmentation produced no chunks for ${audioPath}`);
+      }
+      console.log(`Split ${duration.toFixed(0)}s of audio into ${chunks.length} chunks of ${chunkSeconds}s`);
+
+      // Stop handing out chunks once one fails, so queued chunks don't burn API calls
+      const results: TranscriptSegment[][] = new Array(chunks.length);
+      let next = 0;
+      let firstError: unknown;
+      let failed = false;
+      const runNext = async () => {
+        while (!failed && next < chunks.length) {
+          const index = next++;
+          const offset = index * chunkSeconds;
+          try {
+            const segments = await this.transcribeFile(chunks[index]);
+            results[index] = segments.map(s => ({ start: s.start + offset, end: s.end + offset, text: s.text }));
+          } catch (error) {
+            if (!failed) {
+              failed = true;
+              firstError = error;
+            }
+          }
+        }
+      };
+
+      // Wait for in-flight chunks to settle before the finally block removes their files
+      await Promise.allSettled(
+        Array.from({ length: Math.min(MAX_CONCURRENT_CHUNKS, chunks.length) }, runNext)
+      );
+      if (failed) {
+        throw firstError;
+      }
+
+      return results.flat();
+    } finally {
+      fs.rmSync(chunkDir, { recursive: true, force: true });
+    }
+  }
+
+  private async transcribeFile(audioPath: string): Promise<TranscriptSegment[]> {
     // Aggressive retry wrapper
     const retryWithBackoff = async (fn: () => Promise<any>, maxAttempts: number = 3): Promise<any> => {
       for (let attempt = 1; attempt <= maxAttempts; attempt++) {
@@ -110,6 +180,13 @@ export class OpenAIService {
           return await fn();
         } catch (error: any) {
           if (attempt === maxAttempts) throw error;
+
+          // The client (maxRetries: 3) already retries 408/409/429/5xx honouring Retry-After,
+          // so any HTTP error reaching here is final; only retry connection-level failures
+          const status: number | undefined = error?.status;
+          if (status) {
+            throw error;
+          }
           
           // Wait longer between retries for connection issues
           const waitTime = Math.min(1000 * Math.pow(2, attempt), 10000);
@@ -62,9 +62,9 @@ export class TranscodeProcessor {
 
       // Download input from S3
       const originalFilename = meeting.originalFilename || 'input.mp4';
-      const inputExtension = originalFilename.split('.').pop() || 'mp4';
+      const inputExtension = path.extname(originalFilename) || '.mp4';
       const inputS3Key = `${meeting.s3Prefix}/${originalFilename}`;
-      const inputTempPath = path.join(tempDir, `input.${inputExtension}`);
+      const inputTempPath = path.join(tempDir, `input${inputExtension}`);
 
       console.log(`📥 Downloading from S3: ${inputS3Key}`);
       await this.downloadFromS3(inputS3Key, inputTempPath);
@@ -161,18 +161,42 @@ export class TranscodeProcessor {
 
   /**
    * Upload file to S3
+   * Streams from disk so memory use stays flat regardless of rendition size.
+   * A consumed stream can't be replayed by the SDK's built-in retries, so each
+   * attempt here reopens the file and retries transient failures (5xx, SlowDown, network)
    */
-  private async uploadToS3(localPath: string, key: string, contentType: string): Promise<void> {
-    const fileBuffer = fs.readFileSync(localPath);
+  private async uploadToS3(localPath: string, key: string, contentType: string, maxAttempts: number = 3): Promise<void> {
+    const { size } = fs.statSync(localPath);
+
+    for (let attempt = 1; attempt <= maxAttempts; attempt++) {
+      const body = fs.createReadStream(localPath);
+
+      try {
+        const command = new PutObjectCommand({
+          Bucket: this.config.s3Bucket,
+          Key: key,
+          Body: body,
+          ContentLength: size, // Required by S3 for streamed bodies
+          ContentType: contentType
+        });
 
-    const command = new PutObjectCommand({
-      Bucket: this.config.s3Bucket,
-      Key: key,
-      Body: fileBuffer,
-      ContentType: contentType
-    });
+        await this.s3Client.send(command);
+        return;
+      } catch (error: any) {
+        const status: number | undefined = error?.$metadata?.httpStatusCode;
+        const retryable = !status || status >= 500 || status === 429;
+        if (!retryable || attempt === maxAttempts) {
+          throw error;
+        }
 
-    await this.s3Client.send(command);
+        // Exponential backoff: 1s, 2s
+        const backoffMs = Math.pow(2, attempt - 1) * 1000;
+        console.warn(`⚠️ S3 upload of ${key} failed (attempt ${attempt}/${maxAttempts}), retrying in ${backoffMs}ms:`, error?.message || error);
+        await new Promise(resolve => setTimeout(resolve, backoffMs));
+      } finally {
+        body.destroy();
+      }
+    }
   }
 
   /**
@@ -251,7 +275,9 @@ export class TranscodeProcessor {
    * Get video duration using ffprobe
    */
   private async getVideoDuration(videoPath: string): Promise<number> {
-    const ffprobePath = this.config.ffmpegPath.replace(/ffmpeg\.exe$/, 'ffprobe.exe');
+    // ffprobe ships alongside ffmpeg: swap the binary name, keep directory and any .exe suffix
+    const { dir, base } = path.parse(this.config.ffmpegPath);
+    const ffprobePath = path.join(dir, base.replace(/^ffmpeg/i, 'ffprobe'));
 
     return new Promise((resolve, reject) => {
       const args = [